@@ -4,7 +4,6 @@
 
 # Standard library imports
 from datetime import datetime
-from datetime import timedelta
 import random as random
 
 # Third party imports
@@ -30,6 +29,9 @@ DPOA = {'D': 365, 'B': 252, 'W': 52,
 fmt = "%Y-%m-%d %H:%M:%S"
 fmtz = "%Y-%m-%d %H:%M:%S %Z%z"
 
+# Default random number generator
+random_generator = np.random.default_rng()
+
 
 #---------#---------#---------#---------#---------#---------#---------#---------#---------#
 
@@ -195,6 +197,42 @@ class Market:
 # GENERAL FUNCTIONS RELATED TO MARKET
 
 
+def _market_names(n_ticks, n_assets, date, date_type="end", interval_type='D'):
+    """
+    Returns the row index and the column names of a market dataframe
+    of n_ticks rows and n_assets columns, as described in set_market_names.
+    """
+    
+    # Column names
+    columns = [f"Asset {i}" for i in range(n_assets)]
+    
+    # Row names
+    # Quick check the current date has the right format:
+    try:
+        date = datetime.strptime(date, "%Y-%m-%d")
+    except (ValueError, TypeError):
+        raise ValueError("Current date format does not seem right.")
+    
+    # Generate the dates
+    if interval_type not in ['D', 'M', 'Y']:
+        raise ValueError("interval_type choice is not recognized.")
+    
+    # either from start date
+    if date_type == "start":
+        first_period = pd.Period(date, freq=interval_type)
+    
+    # or from the end date
+    elif date_type == "end":
+        first_period = pd.Period(date, freq=interval_type) - n_ticks
+    
+    else:
+        raise ValueError("date_type choice is not recognized.")
+    
+    index = pd.period_range(start=first_period, periods=n_ticks, freq=interval_type)
+    
+    return index, columns
+
+
 def set_market_names(data, date, date_type="end", interval_type='D'):
     """
     Sets the column and row names of the market dataframe.
@@ -207,7 +245,7 @@ def set_market_names(data, date, date_type="end", interval_type='D'):
       A specific date.
     date_type : str
       Value "end" for 'date' specifying the data end date, "start" for the start date.
-    interval_type : str or DateOffset
+    interval_type : str
       Specifies nature of the jump between two dates ('D' for days, 'M' for months, 'Y' for years).
     
     Returns
@@ -218,12 +256,14 @@ def set_market_names(data, date, date_type="end", interval_type='D'):
     Raises
     ------
     ValueError
-      If the choice for 'date_type' is neither "start" or "end".
+      If the choice for 'date_type' is neither "start" or "end",
+      if 'interval_type' is not one of 'D', 'M' or 'Y',
+      or if 'date' is not in the format "%Y-%m-%d".
     
     Notes
     -----
-     The two ways ("end" and "start") of specifying the dates are approximative.
-     Uncertainty on the dates are of the order of the interval type.
+     With date_type="start", the first period is the one containing 'date'.
+     With date_type="end", the last period is the one preceding the period containing 'date'.
      
      For offset aliases available see:
      https://pandas.pydata.org/pandas-docs/stable/user_guide/timeseries.html#timeseries-offset-aliases.
@@ -233,53 +273,9 @@ def set_market_names(data, date, date_type="end", interval_type='D'):
       None
     """
     
-    # Initializations
-    n_ticks = data.shape[0]
-    n_assets = data.shape[1]
-    
-    # Setting the column names
-    data.columns = map(lambda x: "Asset " + str(x), range(n_assets))
-    
-    # Setting the row names
-    # Quick check the current date has the right format:
-    try:
-        date = datetime.strptime(date, "%Y-%m-%d")
-    except:
-        ValueError("Current date format does not seem right.")
-        
-    # Generate the dates
-    # either from end date
-    if date_type == "start":
-        
-        if interval_type == 'D':
-            date_series = date + pd.to_timedelta(np.arange(n_ticks), unit='D')
-            
-        elif interval_type == 'M':
-            date_series = date + pd.to_timedelta(np.arange(n_ticks) * 12, unit='D')
-            
-        elif interval_type == 'Y':
-            date_series = date + pd.to_timedelta(np.arange(n_ticks) * 365, unit='D')
-            
-    # or from the start date
-    elif date_type == "end":
-        
-        if interval_type == 'D':
-            date_series = date - timedelta(days=n_ticks) \
-                               + pd.to_timedelta(np.arange(n_ticks), unit='D')
-            
-        elif interval_type == 'M':
-            date_series = date - timedelta(days=int(n_ticks * (365./12.))) \
-                               + pd.to_timedelta(np.arange(n_ticks) * int(365./12.), unit='D')
-            
-        elif interval_type == 'Y':
-            date_series = date - timedelta(days=int(n_ticks * 365)) \
-                               + pd.to_timedelta(np.arange(n_ticks) * 365, unit='D')
-            
-    else:
-        ValueError("date_type choice is not recognized.")
-        
-    # Affecting the value to the rows names
-    data.index = date_series.to_period(interval_type)
+    # Affecting the values to the rows and column names
+    data.index, data.columns = _market_names(data.shape[0], data.shape[1], date=date,
+                                             date_type=date_type, interval_type=interval_type)
     
     return None
 
@@ -287,7 +283,7 @@ def set_market_names(data, date, date_type="end", interval_type='D'):
 def create_market_returns(r_ini, drift, sigma, n_years,
                           steps_per_year, n_components,
                           date, date_type, interval_type='D',
-                          tz=None, units=None, name=""):
+                          tz=None, units=None, name="", dtype=np.float64, rng=None):
     """
     Creates a market from a Geometric Brownian process for each stock.
     
@@ -310,6 +306,10 @@ def create_market_returns(r_ini, drift, sigma, n_years,
       Number of steps per year.
     n_components : int
       Number of components of the market.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
     
     Notes
     -----
@@ -329,16 +329,24 @@ def create_market_returns(r_ini, drift, sigma, n_years,
     # Initialization
     dt = 1/steps_per_year
     n_steps = int(n_years * steps_per_year) + 1
+    if rng is None:
+        rng = random_generator
     
     # Compute r_t + 1
-    rets_plus_1 = np.random.normal(loc=(1+drift)**dt,
-                                   scale=(sigma*np.sqrt(dt)),
-                                   size=(n_steps, n_components))
-    rets_plus_1[0] = 1
-    df_returns = r_ini * pd.DataFrame(rets_plus_1).cumprod()
+    rets_plus_1 = np.empty((n_steps, n_components), dtype=dtype)
+    rets_plus_1[0] = 1.
+    rng.standard_normal(out=rets_plus_1[1:], dtype=dtype)
+    rets_plus_1[1:] *= sigma * np.sqrt(dt)
+    rets_plus_1[1:] += (1+drift)**dt
 
-    # Set market index and column names
-    set_market_names(df_returns, date=date, date_type=date_type, interval_type=interval_type)
+    # Compute the values from the cumulative product of returns
+    np.cumprod(rets_plus_1, axis=0, dtype=dtype, out=rets_plus_1)
+    rets_plus_1 *= r_ini
+
+    # Make the dataframe with its index and column names, without copying the values
+    index, columns = _market_names(n_steps, n_components, date=date,
+                                   date_type=date_type, interval_type=interval_type)
+    df_returns = pd.DataFrame(rets_plus_1, index=index, columns=columns, copy=False)
     
     # Make a market
     market_returns = Market(df=df_returns, tz=tz, units=units, name=name)
@@ -346,7 +354,7 @@ def create_market_returns(r_ini, drift, sigma, n_years,
     return market_returns
 
 
-def create_market_shares(market, mean=100000, stdv=10000):
+def create_market_shares(market, mean=100000, stdv=10000, rng=None):
     """
     Creates a list of randomly generated numbers of shares for a market.
     The number of shares is generated from a normal distribution.
@@ -359,6 +367,8 @@ def create_market_shares(market, mean=100000, stdv=10000):
       The average value of a market share.
     stdv : float
       The standard deviation of the market shares.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
@@ -369,18 +379,22 @@ def create_market_shares(market, mean=100000, stdv=10000):
     # Checks
     assert(isinstance(market, Market))
     
+    # Initialization
+    if rng is None:
+        rng = random_generator
+    
     # Get number of assets
     n_assets = market.data.shape[1]
     
     # Create market shares
-    market_shares = pd.Series( [int(np.random.normal(loc=mean, scale=stdv, size=1)) 
-                                for _ in range(n_assets)] )
-    market_shares.index = market.data.columns
+    shares = rng.normal(loc=mean, scale=stdv, size=n_assets).astype(np.int64)
     
     # Checks
-    if market_shares.min() < 0:
+    if shares.min() < 0:
         raise ValueError("A negative market share was generated, please launch again.")
     
+    market_shares = pd.Series(shares, index=market.data.columns)
+    
     return market_shares
 
 
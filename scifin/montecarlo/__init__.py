@@ -6,5 +6,5 @@ __author__ = "Fabien Nugier"
 The :mod:`scifin.montecarlo` module includes methods for Monte Carlo simulations.
 """
 
-from .montecarlo import generate_series
+from .montecarlo import generate_series, spawn_rngs
 
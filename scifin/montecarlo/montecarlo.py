@@ -53,5 +53,39 @@ def generate_series(n=1, generate_names=True, names_base="rs", series_model=None
     return L
 
 
+def spawn_rngs(n=1, seed=None):
+    """
+    Generate a list of `n` independent random number generators,
+    e.g. to simulate series in parallel threads or processes.
+    
+    Parameters
+    ----------
+    n : int
+      Number of generators to be generated.
+    seed : None, int or sequence of ints
+      Entropy of the parent seed sequence, taken from the OS if None.
+      
+    Returns
+    -------
+    List of numpy.random.Generator
+      The n generators, built from the children of one SeedSequence.
+    
+    Notes
+    -----
+      Generators use the PCG64DXSM bit generator,
+      or PCG64 for versions of numpy where it is not available (<1.21).
+    """
+    
+    # Checks
+    assert(isinstance(n,int))
+    
+    # Create list
+    bit_generator = getattr(np.random, 'PCG64DXSM', np.random.PCG64)
+    seed_seqs = np.random.SeedSequence(seed).spawn(n)
+    L = [np.random.Generator(bit_generator(s)) for s in seed_seqs]
+    
+    return L
+
+
 
 #---------#---------#---------#---------#---------#---------#---------#---------#---------#
\ No newline at end of file
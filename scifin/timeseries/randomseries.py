@@ -4,26 +4,347 @@
 
 # Standard library imports
 from datetime import datetime
+from functools import lru_cache
 
 # Third party imports
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
+from scipy.signal import fftconvolve, lfilter, lfiltic
 
 # Local application imports
 from . import TimeSeries
 
 
+# Number of scenarios above which batched AR recursions
+# are run as one BLAS product per time step instead of lfilter.
+BLAS_MIN_SCENARIOS = 256
+
+# Size T * (P + Q) above which single ARMA paths are generated by the numba kernel,
+# smaller ones not being worth the compilation or cache loading time of the kernel.
+NUMBA_MIN_SIZE = 50000
+
+# Order of MA processes from which the MA filter is computed as an FFT convolution.
+FFT_MIN_ORDER = 256
+
+# Default random number generator
+random_generator = np.random.default_rng()
+
+
 #---------#---------#---------#---------#---------#---------#---------#---------#---------#
 
 
+### HELPER FUNCTIONS ###
+
+
+def _white_noise(size, sigma, dtype=np.float64, rng=None):
+    """
+    Generates a Gaussian white noise with standard deviation sigma
+    from the generator rng, or the module default one if rng is None.
+    
+    The standard normal draws are written directly into the returned buffer
+    and scaled in place, avoiding a temporary array of the same size.
+    The draws are made in single precision if dtype is np.float32.
+    """
+    
+    if rng is None:
+        rng = random_generator
+    
+    noise = np.empty(size, dtype=dtype)
+    rng.standard_normal(out=noise, dtype=dtype)
+    noise *= sigma
+    
+    return noise
+
+
+@lru_cache(maxsize=128)
+def _cached_index(start_date, end_date, frequency):
+    """
+    Generates the dates index between start_date and end_date,
+    keeping the last generated indices in memory.
+    """
+    
+    return pd.date_range(start=start_date, end=end_date, freq=frequency)
+
+
+def _make_index(start_date, end_date, frequency):
+    """
+    Returns the dates index of a time series between start_date and end_date.
+    
+    The index is only built once for repeated calls with the same dates and frequency,
+    a shallow copy of it being returned so the cached index is never modified.
+    """
+    
+    return _cached_index(start_date, end_date, frequency).copy()
+
+
+def _ar_recursion(start_values, coeffs, u):
+    """
+    Computes the linear recursion x_t = u_t + Sum_{p=0}^{P-1} coeffs[p] * x_{t-p-1}
+    for t >= P, the P first values of x being imposed by start_values.
+    
+    The recursion is run by scipy.signal.lfilter as an IIR filter,
+    the initial values being passed as the filter initial conditions.
+    If u has shape (T, N), the N scenarios are filtered along the time axis
+    and all start from the same initial values.
+    The result has the floating point type of u.
+    """
+    
+    P = len(start_values)
+    start_values = np.asarray(start_values, dtype=u.dtype)
+    shape_ini = (P,) + (1,) * (u.ndim - 1)
+    x = np.empty(u.shape, dtype=u.dtype)
+    x[:P] = start_values.reshape(shape_ini)
+    
+    # Filter coefficients of the AR polynomial
+    ar_poly = np.concatenate(([1.], -np.asarray(coeffs, dtype=np.float64))).astype(u.dtype)
+    one = np.ones(1, dtype=u.dtype)
+    zi = lfiltic(one, ar_poly, y=start_values[::-1]).astype(u.dtype)
+    zi = np.broadcast_to(zi.reshape(shape_ini), (P,) + u.shape[1:])
+    x[P:], _ = lfilter(one, ar_poly, u[P:], axis=0, zi=zi)
+    
+    return x
+
+
+def _ar_recursion_blas(start_values, coeffs, u):
+    """
+    Computes the same recursion as _ar_recursion for u of shape (T, N),
+    each time step updating the N scenarios together with a BLAS product
+    between the reversed coefficients and the (P, N) block of the P previous values.
+    """
+    
+    P = len(start_values)
+    x = np.empty(u.shape, dtype=u.dtype)
+    x[:P] = np.asarray(start_values, dtype=u.dtype)[:,None]
+    
+    # Reversed coefficients, so that they apply to x[t-P:t] in increasing time order
+    coeffs_rev = np.ascontiguousarray(np.asarray(coeffs, dtype=u.dtype)[::-1])
+    
+    for t in range(P,x.shape[0],1):
+        np.dot(coeffs_rev, x[t-P:t], out=x[t])
+        x[t] += u[t]
+    
+    return x
+
+
+def _ma_filter(coeffs, a):
+    """
+    Computes a_t - Sum_{q=0}^{Q-1} coeffs[q] * a_{t-q-1} along the first axis of a,
+    the values of a before t=0 being taken as zero.
+    
+    This is the convolution of a with [1, -coeffs] truncated to the length of a,
+    computed by FFT for orders of at least FFT_MIN_ORDER and directly otherwise.
+    """
+    
+    T = a.shape[0]
+    ma_poly = np.concatenate(([1.], -np.asarray(coeffs, dtype=np.float64))).astype(a.dtype)
+    
+    if len(ma_poly) - 1 >= FFT_MIN_ORDER:
+        ma_poly = ma_poly.reshape((-1,) + (1,) * (a.ndim - 1))
+        return fftconvolve(a, ma_poly, mode='full', axes=0)[:T]
+    
+    if a.ndim == 1:
+        return np.convolve(a, ma_poly, mode='full')[:T]
+    
+    return lfilter(ma_poly, np.ones(1, dtype=a.dtype), a, axis=0)
+
+
+def _pack_arma_coeffs(ARcoeffs, MAcoeffs, dtype):
+    """
+    Packs the AR coefficients and the opposite of the MA coefficients
+    into one contiguous array of shape (P+Q,) and type dtype.
+    
+    The AR and MA parts are the slices [:P] and [P:] of the packed array.
+    """
+    
+    P = len(ARcoeffs)
+    packed = np.empty(P + len(MAcoeffs), dtype=dtype)
+    packed[:P] = ARcoeffs
+    packed[P:] = MAcoeffs
+    np.negative(packed[P:], out=packed[P:])
+    
+    return packed
+
+
+def _arma_kernel(a, x, cst, coeffs, P, start_values):
+    """
+    Fills x with the ARMA recursion
+    x_t = cst + Sum_{p=0}^{P-1} ARcoeffs[p] * x_{t-p-1} + a_t - Sum_{q=0}^{Q-1} MAcoeffs[q] * a_{t-q-1}
+    for t >= P, the P first values of x being imposed by start_values.
+    
+    The coefficients are packed by _pack_arma_coeffs. The P last values of x
+    and Q last values of a are kept most recent first in doubled ring buffers,
+    each value being written at its head h and at h plus the buffer length,
+    so that the history read from the head is contiguous and walked
+    in the same direction as the coefficients. Noise values before the start are zero.
+    
+    All arguments except cst and P are expected to be contiguous arrays of the same
+    floating point type, this function being compiled with numba by _compiled_arma_kernel.
+    """
+    
+    K = coeffs.shape[0]
+    Q = K - P
+    T = x.shape[0]
+    
+    # Ring buffers of the last values of x and a, and their heads
+    x_hist = np.zeros(2*P, dtype=x.dtype)
+    a_hist = np.zeros(2*Q, dtype=x.dtype)
+    h = 0
+    g = 0
+    
+    for t in range(T):
+        if t < P:
+            x_t = start_values[t]
+        else:
+            x_t = cst + a[t]
+            for p in range(P):
+                x_t += coeffs[p] * x_hist[h+p]
+            for q in range(Q):
+                x_t += coeffs[P+q] * a_hist[g+q]
+        x[t] = x_t
+        
+        # Move the heads backwards and store the new values
+        if P > 0:
+            h = h - 1 if h > 0 else P - 1
+            x_hist[h] = x_t
+            x_hist[h+P] = x_t
+        if Q > 0:
+            g = g - 1 if g > 0 else Q - 1
+            a_hist[g] = a[t]
+            a_hist[g+Q] = a[t]
+    
+    return x
+
+
+@lru_cache(maxsize=None)
+def _compiled_arma_kernel():
+    """
+    Returns _arma_kernel compiled with numba, or None if numba is not available.
+    
+    Numba is only imported at the first call, so that importing scifin
+    does not pay for loading it when no large ARMA series is generated.
+    """
+    
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+    
+    return njit(cache=True, fastmath=True)(_arma_kernel)
+
+
+@lru_cache(maxsize=None)
+def _compiled_arma_paths_kernel():
+    """
+    Returns a numba kernel generating independent ARMA paths in parallel,
+    or None if numba is not available.
+    
+    The kernel fills each row of x with one path, run by the compiled _arma_kernel
+    from the corresponding row of the white noise a.
+    The kernel is compiled at its first call in each process, as numba cannot cache
+    parallel closures on disk, which costs about two seconds.
+    """
+    
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+    
+    arma_kernel = _compiled_arma_kernel()
+    
+    def _arma_paths_kernel(a, x, cst, coeffs, P, start_values):
+        for s in prange(x.shape[0]):
+            arma_kernel(a[s], x[s], cst, coeffs, P, start_values)
+        return x
+    
+    return njit(parallel=True)(_arma_paths_kernel)
+
+
+def _arma_series(start_values, cst, ARcoeffs, MAcoeffs, a):
+    """
+    Generates the values of an ARMA process driven by the white noise a.
+    
+    A single path is generated by the numba kernel if its size T * (P + Q)
+    is above NUMBA_MIN_SIZE and numba is available, and by lfilter otherwise.
+    Several scenarios given as the columns of a are run by lfilter,
+    or by BLAS products if there are at least BLAS_MIN_SCENARIOS of them.
+    """
+    
+    kernel = None
+    if (a.ndim == 1) and (len(a) * (len(ARcoeffs) + len(MAcoeffs)) > NUMBA_MIN_SIZE):
+        kernel = _compiled_arma_kernel()
+    
+    if kernel is not None:
+        x = np.empty(len(a), dtype=a.dtype)
+        return kernel(a, x, float(cst),
+                      _pack_arma_coeffs(ARcoeffs, MAcoeffs, a.dtype), len(ARcoeffs),
+                      np.ascontiguousarray(start_values, dtype=a.dtype))
+    
+    u = cst + _ma_filter(MAcoeffs, a)
+    if (a.ndim == 2) and (a.shape[1] >= BLAS_MIN_SCENARIOS):
+        return _ar_recursion_blas(start_values, ARcoeffs, u)
+    
+    return _ar_recursion(start_values, ARcoeffs, u)
+
+
+def _arma_paths(start_values, cst, ARcoeffs, MAcoeffs, sigma, T, n_scenarios, dtype, rng,
+                parallel=False):
+    """
+    Generates n_scenarios paths of length T of an ARMA process,
+    returned as an array of shape (T,) or (T, n_scenarios).
+    
+    The white noise is drawn from rng. If parallel is True and numba is available,
+    several scenarios are generated in parallel by the numba paths kernel,
+    with one row of noise per scenario. Otherwise the paths are generated by _arma_series.
+    """
+    
+    if rng is None:
+        rng = random_generator
+    
+    kernel = None
+    if parallel and (n_scenarios > 1):
+        kernel = _compiled_arma_paths_kernel()
+    
+    if kernel is not None:
+        a = _white_noise((n_scenarios, T), sigma, dtype, rng=rng)
+        x = np.empty((n_scenarios, T), dtype=dtype)
+        kernel(a, x, float(cst),
+               _pack_arma_coeffs(ARcoeffs, MAcoeffs, dtype), len(ARcoeffs),
+               np.ascontiguousarray(start_values, dtype=dtype))
+        return x.T
+    
+    size = T if n_scenarios == 1 else (T, n_scenarios)
+    a = _white_noise(size, sigma, dtype, rng=rng)
+    
+    return _arma_series(start_values, cst, ARcoeffs, MAcoeffs, a)
+
+
+def _make_series(data_index, x, tz, unit, name):
+    """
+    Makes a TimeSeries out of the values x,
+    or a list of TimeSeries if x has one column per scenario,
+    named from name and the scenario number as in montecarlo.generate_series.
+    
+    Each TimeSeries infers the frequency of its index, so that wrapping many
+    scenarios can take longer than generating them.
+    """
+    
+    if x.ndim == 1:
+        df = pd.DataFrame(index=data_index, data=x)
+        return TimeSeries(df, tz=tz, unit=unit, name=name)
+    
+    return [TimeSeries(pd.Series(index=data_index, data=x[:,i]), tz=tz, unit=unit, name=name+str(i))
+            for i in range(x.shape[1])]
+
+
+
 ### TIME SERIES MODELS ###
 
 
 # Simple models
 
 
-def constant(start_date, end_date, frequency, cst=0., sigma=0., tz=None, unit=None, name=""):
+def constant(start_date, end_date, frequency, cst=0., sigma=0., tz=None, unit=None, name="", rng=None):
     """
     Defines a time series with constant numerical value
     and eventually add a noise to it.
@@ -44,6 +365,8 @@ def constant(start_date, end_date, frequency, cst=0., sigma=0., tz=None, unit=No
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
 
     Returns
     -------
@@ -70,15 +393,15 @@ def constant(start_date, end_date, frequency, cst=0., sigma=0., tz=None, unit=No
     assert(isinstance(sigma, int) or isinstance(sigma, float))
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate data
     if float(sigma) != 0.:
-        rand_val = np.random.normal(loc=0., scale=sigma, size=T)
-        data_vals = [cst] * T + rand_val
+        rand_val = _white_noise(T, sigma, rng=rng)
+        data_vals = cst + rand_val
     else:
-        data_vals = [cst] * T
+        data_vals = np.full(T, cst)
 
     # Make time series
     df = pd.DataFrame(index=data_index, data=data_vals)
@@ -93,7 +416,9 @@ def constant(start_date, end_date, frequency, cst=0., sigma=0., tz=None, unit=No
 # These models describe the evolution of time series.
 
 
-def auto_regressive(start_date, end_date, frequency, start_values, cst, order, coeffs, sigma, tz=None, unit=None, name=""):
+def auto_regressive(start_date, end_date, frequency, start_values, cst, order, coeffs, sigma,
+                    tz=None, unit=None, name="", n_scenarios=1, verbose=False,
+                    dtype=np.float64, rng=None, parallel=False):
     """
     Generates a time series from the Auto-Regressive (AR) model of arbitrary order P.
     
@@ -125,11 +450,25 @@ def auto_regressive(start_date, end_date, frequency, start_values, cst, order, c
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    n_scenarios : int
+      Number of independent scenarios to generate, named from name and their number.
+      Each scenario is wrapped in its own TimeSeries, which takes about 0.1 ms per scenario
+      and can exceed the generation time of the whole batch.
+    verbose : bool
+      Verbose option, printing the theoretical values of the process.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
+    parallel : bool
+      Generates the scenarios in parallel with numba if it is available.
+      The parallel kernel is compiled at its first call in each process.
     
     Returns
     -------
-    TimeSeries
-      The time series resulting from the Auto-Regressive process.
+    TimeSeries or list of TimeSeries
+      The time series resulting from the Auto-Regressive process,
+      or a list of n_scenarios such time series if n_scenarios > 1.
     
     Raises
     ------
@@ -147,39 +486,36 @@ def auto_regressive(start_date, end_date, frequency, start_values, cst, order, c
     """
     
     # Checks
+    assert(isinstance(n_scenarios, int) and n_scenarios>=1)
     assert(len(coeffs)==order)
     assert(len(start_values)==order)
     P = len(start_values)
     
+    # Initializations
+    coeffs = np.ascontiguousarray(coeffs, dtype=np.float64)
+    start_values = np.ascontiguousarray(start_values, dtype=np.float64)
+    
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
-    # Generate the white noise (Note: p first values are not used)
-    a = np.random.normal(loc=0., scale=sigma, size=T)
-    
     # Generate the random series
-    x = [0.] * T
-    for t_ini in range(P):
-        x[t_ini] = start_values[t_ini]
-    for t in range(P,T,1):
-        x[t] = cst + a[t]
-        for p in range(P):
-            x[t] += coeffs[p] * x[t-p-1]
+    x = _arma_paths(start_values, cst, coeffs, [], sigma, T, n_scenarios, dtype, rng, parallel)
     
     # Compute theoretical expectation value
-    E = cst / (1 - sum(coeffs))
-    print("Under stationarity assumption, the expected value for this AR("
-          + str(P) + ") model is: " + str(E) + "\n")
+    if verbose:
+        E = cst / (1. - coeffs.sum())
+        print("Under stationarity assumption, the expected value for this AR("
+              + str(P) + ") model is: " + str(E) + "\n")
     
     # Combine them into a time series
-    df = pd.DataFrame(index=data_index, data=x)
-    rs = TimeSeries(df, tz=tz, unit=unit, name=name)
+    rs = _make_series(data_index, x, tz, unit, name)
     
     return rs
 
 
-def random_walk(start_date, end_date, frequency, start_value, sigma, tz=None, unit=None, name=""):
+def random_walk(start_date, end_date, frequency, start_value, sigma,
+                tz=None, unit=None, name="", dtype=np.float64, rng=None):
     """
     Generates a time series from the Random Walk process,
     i.e. an AR(1) model with {cst = 0, coeff[0] = 1}.
@@ -204,6 +540,10 @@ def random_walk(start_date, end_date, frequency, start_value, sigma, tz=None, un
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
     
     Returns
     -------
@@ -226,17 +566,15 @@ def random_walk(start_date, end_date, frequency, start_value, sigma, tz=None, un
     """
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the white noise (Note: first value is not used)
-    a = np.random.normal(loc=0., scale=sigma, size=T)
+    a = _white_noise(T, sigma, dtype, rng=rng)
     
     # Generate the random series
-    x = [0.] * T
-    x[0] = start_value
-    for t in range(1,T,1):
-        x[t] = x[t-1] + a[t]
+    a[0] = start_value
+    x = np.cumsum(a, out=a)
     
     # Combine them into a time series
     df = pd.DataFrame(index=data_index, data=x)
@@ -245,7 +583,8 @@ def random_walk(start_date, end_date, frequency, start_value, sigma, tz=None, un
     return rs
 
 
-def drift_random_walk(start_date, end_date, frequency, start_value, drift, sigma, tz=None, unit=None, name=""):
+def drift_random_walk(start_date, end_date, frequency, start_value, drift, sigma,
+                      tz=None, unit=None, name="", dtype=np.float64, rng=None):
     """
     Generates a time series from the Random Walk with Drift process,
     i.e. an AR(1) model with {cst != 0, coeffs[0] = 1}.
@@ -272,6 +611,10 @@ def drift_random_walk(start_date, end_date, frequency, start_value, drift, sigma
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
     
     Returns
     -------
@@ -294,17 +637,16 @@ def drift_random_walk(start_date, end_date, frequency, start_value, drift, sigma
     """
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the white noise (Note: first value is not used)
-    a = np.random.normal(loc=0., scale=sigma, size=T)
+    a = _white_noise(T, sigma, dtype, rng=rng)
     
     # Generate the random series
-    x = [0.] * T
-    x[0] = start_value
-    for t in range(1,T,1):
-        x[t] = drift + x[t-1] + a[t]
+    a[0] = start_value
+    a[1:] += drift
+    x = np.cumsum(a, out=a)
     
     # Combine them into a time series
     df = pd.DataFrame(index=data_index, data=x)
@@ -313,20 +655,22 @@ def drift_random_walk(start_date, end_date, frequency, start_value, drift, sigma
     return rs
 
 
-def moving_average(start_date, end_date, frequency, cst, order, coeffs, sigma, tz=None, unit=None, name=""):
+def moving_average(start_date, end_date, frequency, cst, order, coeffs, sigma,
+                   tz=None, unit=None, name="", n_scenarios=1, verbose=False,
+                   dtype=np.float64, rng=None):
     """
     Generates a time series from the Moving Average (MA) model of arbitrary order Q.
     
     The model is of the form:
-    x_t = cst + a_t + coeffs[0] * a_{t-1} + ... + coeffs[Q-1] * a_{t-Q}
+    x_t = cst + a_t - coeffs[0] * a_{t-1} - ... - coeffs[Q-1] * a_{t-Q}
     where {a_t} is the white noise series with standard deviation sigma.
 
     We don't need to impose any initial values for {x_t}, they are imposed directly from {a_t}.
     
     To be clear, the initial steps of the process are:
     x_0 = cst + a_0
-    x_1 = cst + a_1 + coeffs[0] * a_0
-    x_2 = cst + a_2 + coeffs[0] * a_1 + coeffs[1] * a_0
+    x_1 = cst + a_1 - coeffs[0] * a_0
+    x_2 = cst + a_2 - coeffs[0] * a_1 - coeffs[1] * a_0
     
     Parameters
     ----------
@@ -348,11 +692,22 @@ def moving_average(start_date, end_date, frequency, cst, order, coeffs, sigma, t
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    n_scenarios : int
+      Number of independent scenarios to generate, named from name and their number.
+      Each scenario is wrapped in its own TimeSeries, which takes about 0.1 ms per scenario
+      and can exceed the generation time of the whole batch.
+    verbose : bool
+      Verbose option, printing the theoretical values of the process.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
-    TimeSeries
-      The time series resulting from the Moving Average process.
+    TimeSeries or list of TimeSeries
+      The time series resulting from the Moving Average process,
+      or a list of n_scenarios such time series if n_scenarios > 1.
     
     Raises
     ------
@@ -370,50 +725,48 @@ def moving_average(start_date, end_date, frequency, cst, order, coeffs, sigma, t
     """
     
     # Checks
+    assert(isinstance(n_scenarios, int) and n_scenarios>=1)
     assert(len(coeffs)==order)
     Q = order
     
+    # Initializations
+    coeffs = np.ascontiguousarray(coeffs, dtype=np.float64)
+    
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the white noise
-    a = np.random.normal(loc=0., scale=sigma, size=T)
+    size = T if n_scenarios == 1 else (T, n_scenarios)
+    a = _white_noise(size, sigma, dtype, rng=rng)
     
     # Generate the random series
-    x = [0.] * T
-    for t in range(T):
-        x[t] = cst + a[t]
-        for q in range(Q):
-            if t-q > 0:
-                x[t] -= coeffs[q] * a[t-q-1]
+    x = cst + _ma_filter(coeffs, a)
     
     # Compute theoretical values
-    V = 1.
-    for q in range(Q):
-        V += coeffs[q]**2
-    V *= sigma**2
-    print("The expected value for this MA(" + str(Q) + ") model is: " + str(cst))
-    print("The estimation of the variance for this MA(" + str(Q) + ") model is: " + str(V) + \
-          " , i.e. a standard deviation of: " + str(np.sqrt(V)) + "\n")
+    if verbose:
+        V = sigma * sigma * (1. + np.dot(coeffs, coeffs))
+        print("The expected value for this MA(" + str(Q) + ") model is: " + str(cst))
+        print("The estimation of the variance for this MA(" + str(Q) + ") model is: " + str(V) + \
+              " , i.e. a standard deviation of: " + str(np.sqrt(V)) + "\n")
     
     # Combine them into a time series
-    df = pd.DataFrame(index=data_index, data=x)
-    rs = TimeSeries(df, tz=tz, unit=unit, name=name)
+    rs = _make_series(data_index, x, tz, unit, name)
     
     return rs
 
 
 
 def arma(start_date, end_date, frequency, start_values,
-         cst, ARorder, ARcoeffs, MAorder, MAcoeffs, sigma, tz=None, unit=None, name=""):
+         cst, ARorder, ARcoeffs, MAorder, MAcoeffs, sigma,
+         tz=None, unit=None, name="", n_scenarios=1, dtype=np.float64, rng=None, parallel=False):
     """
     Function generating a time series from the Auto-Regressive Moving Average (ARMA)
     model of orders (P,Q).
     
     The model is of the form:
-    x_t = cst + Sum_{i=0}^{P-1} ARcoeffs[i] * a_{t-i-1}
-        + a_t + Sum_{j=0}^{Q-1} MAcoeffs[j] * a_{t-j-1}
+    x_t = cst + Sum_{i=0}^{P-1} ARcoeffs[i] * x_{t-i-1}
+        + a_t - Sum_{j=0}^{Q-1} MAcoeffs[j] * a_{t-j-1}
     where {a_t} is the white noise series with standard deviation sigma.
     
     Initial values for {x_0, ..., x_P} are imposed from the values in start_values.
@@ -444,11 +797,23 @@ def arma(start_date, end_date, frequency, start_values,
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    n_scenarios : int
+      Number of independent scenarios to generate, named from name and their number.
+      Each scenario is wrapped in its own TimeSeries, which takes about 0.1 ms per scenario
+      and can exceed the generation time of the whole batch.
+    dtype : numpy dtype
+      Floating point type of the generated values (np.float64 or np.float32).
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
+    parallel : bool
+      Generates the scenarios in parallel with numba if it is available.
+      The parallel kernel is compiled at its first call in each process.
     
     Returns
     -------
-    TimeSeries
-      The time series resulting from the ARMA process.
+    TimeSeries or list of TimeSeries
+      The time series resulting from the ARMA process,
+      or a list of n_scenarios such time series if n_scenarios > 1.
     
     Raises
     ------
@@ -466,42 +831,34 @@ def arma(start_date, end_date, frequency, start_values,
     """
     
     # Checks
+    assert(isinstance(n_scenarios, int) and n_scenarios>=1)
     assert(len(ARcoeffs)==ARorder)
     assert(len(MAcoeffs)==MAorder)
     assert(len(start_values)==ARorder)
     P = ARorder
     Q = MAorder
     
+    # Initializations
+    ARcoeffs = np.ascontiguousarray(ARcoeffs, dtype=np.float64)
+    MAcoeffs = np.ascontiguousarray(MAcoeffs, dtype=np.float64)
+    start_values = np.ascontiguousarray(start_values, dtype=np.float64)
+    
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
-    # Generate the white noise
-    a = np.random.normal(loc=0., scale=sigma, size=T)
-    
     # Generate the random series
-    x = [0.] * T
-    # Taking care of {x_0, x_1, ..., x_P}
-    for t_ini in range(P):
-        x[t_ini] = start_values[t_ini]
-    # Taking care of the rest
-    for t in range(P,T,1):
-        x[t] = cst + a[t]
-        for p in range(P):
-            x[t] += ARcoeffs[p] * x[t-p]
-        for q in range(Q):
-            if t-q > 0:
-                x[t] -= MAcoeffs[q] * x[t-q-1]
+    x = _arma_paths(start_values, cst, ARcoeffs, MAcoeffs, sigma, T, n_scenarios, dtype, rng, parallel)
     
     # Combine them into a time series
-    df = pd.DataFrame(index=data_index, data=x)
-    rs = TimeSeries(df, tz=tz, unit=unit, name=name)
+    rs = _make_series(data_index, x, tz, unit, name)
     
     return rs
 
 
 
-def rca(start_date, end_date, frequency, cst, order, ARcoeffs, cov_matrix, sigma, tz=None, unit=None, name=""):
+def rca(start_date, end_date, frequency, cst, order, ARcoeffs, cov_matrix, sigma,
+        tz=None, unit=None, name="", rng=None):
     """
     Function generating a time series from the Random Coefficient Auto-Regressive (RCA)
     model of order M.
@@ -536,6 +893,8 @@ def rca(start_date, end_date, frequency, cst, order, ARcoeffs, cov_matrix, sigma
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
@@ -572,20 +931,24 @@ def rca(start_date, end_date, frequency, cst, order, ARcoeffs, cov_matrix, sigma
         for x in row:
             assert(x>=0)
     M = order
+    if rng is None:
+        rng = random_generator
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the white noise
-    a = np.random.normal(loc=0., scale=sigma, size=T)
+    a = _white_noise(T, sigma, rng=rng)
+    
+    # Generate the lists of coefficients
+    all_coeffs = rng.multivariate_normal(mean=[0.] * M, cov=cov_matrix, size=T)
     
     # Generate the random series
-    x = [0.] * T
+    x = np.empty(T, dtype=np.float64)
     for t in range(T):
         x[t] = cst + a[t]
-        # Generate the list of coefficients
-        coeffs = np.random.multivariate_normal(mean=[0.] * M, cov=cov_matrix, size=1)[0]
+        coeffs = all_coeffs[t]
         for m in range(M):
             if t-m > 0:
                 x[t] += (ARcoeffs[m] + coeffs[m]) * a[t-m-1]
@@ -602,7 +965,8 @@ def rca(start_date, end_date, frequency, cst, order, ARcoeffs, cov_matrix, sigma
 
 # These models describe the volatility of a time series.
 
-def arch(start_date, end_date, frequency, cst, order, coeffs, tz=None, unit=None, name=""):
+def arch(start_date, end_date, frequency, cst, order, coeffs,
+         tz=None, unit=None, name="", verbose=False, rng=None):
     """
     Function generating a volatility series from the
     Auto-Regressive Conditional Heteroscedastic (ARCH) model of order M.
@@ -635,6 +999,10 @@ def arch(start_date, end_date, frequency, cst, order, coeffs, tz=None, unit=None
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    verbose : bool
+      Verbose option, printing the theoretical values of the process.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
@@ -672,14 +1040,14 @@ def arch(start_date, end_date, frequency, cst, order, coeffs, tz=None, unit=None
     M = order
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the "unit" white noise
-    eps = np.random.normal(loc=0., scale=1, size=T)
+    eps = _white_noise(T, 1., rng=rng)
 
     # Generate the random series
-    a = [0.] * T
+    a = np.empty(T, dtype=np.float64)
     for t in range(T):
         sig_square = cst
         for m in range(M):
@@ -689,12 +1057,13 @@ def arch(start_date, end_date, frequency, cst, order, coeffs, tz=None, unit=None
         a[t] = sig * eps[t]
     
     # Compute theoretical values
-    print("The expected value for this ARCH(" + str(M) \
-          + ") model is 0, like any other ARCH model, and the estimated value is : " \
-          + str(np.mean(a)))
-    V = cst / (1 - sum(coeffs))
-    print("The theoretical standard deviation value for this ARCH(" + str(M) \
-          + ") model is: " + str(V))
+    if verbose:
+        print("The expected value for this ARCH(" + str(M) \
+              + ") model is 0, like any other ARCH model, and the estimated value is : " \
+              + str(np.mean(a)))
+        V = cst / (1 - sum(coeffs))
+        print("The theoretical standard deviation value for this ARCH(" + str(M) \
+              + ") model is: " + str(V))
     
     # Combine them into a time series
     df = pd.DataFrame(index=data_index, data=a)
@@ -703,7 +1072,8 @@ def arch(start_date, end_date, frequency, cst, order, coeffs, tz=None, unit=None
     return rs
 
 
-def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, coeffs_sig, tz=None, unit=None, name=""):
+def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, coeffs_sig,
+          tz=None, unit=None, name="", verbose=False, rng=None):
     """
     Function generating a volatility series from the
     Generalized ARCH (GARCH) model of order M.
@@ -741,6 +1111,10 @@ def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, co
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    verbose : bool
+      Verbose option, printing the theoretical values of the process.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
@@ -780,15 +1154,15 @@ def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, co
     S = order_sig
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the "unit" white noise
-    eps = np.random.normal(loc=0., scale=1, size=T)
+    eps = _white_noise(T, 1., rng=rng)
 
     # Generate the random series
-    a = [0.] * T
-    sig = [0.] * T
+    a = np.empty(T, dtype=np.float64)
+    sig = np.empty(T, dtype=np.float64)
     for t in range(T):
         sig_square = cst
         for m in range(M):
@@ -801,9 +1175,10 @@ def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, co
         a[t] = sig[t] * eps[t]
 
     # Compute theoretical values
-    V = cst / (1 - sum(coeffs_a) - sum(coeffs_sig))
-    print("The theoretical standard deviation for this GARCH(" + str(M) \
-          + "," + str(S) + ") model is: " + str(np.sqrt(V)))
+    if verbose:
+        V = cst / (1 - sum(coeffs_a) - sum(coeffs_sig))
+        print("The theoretical standard deviation for this GARCH(" + str(M) \
+              + "," + str(S) + ") model is: " + str(np.sqrt(V)))
     
     # Combine them into a time series
     df = pd.DataFrame(index=data_index, data=a)
@@ -812,7 +1187,8 @@ def garch(start_date, end_date, frequency, cst, order_a, coeffs_a, order_sig, co
     return rs
 
 
-def charma(start_date, end_date, frequency, order, cov_matrix, sigma, tz=None, unit=None, name=""):
+def charma(start_date, end_date, frequency, order, cov_matrix, sigma,
+           tz=None, unit=None, name="", rng=None):
     """
     Function generating a volatility series from the
     Conditional Heterescedastic ARMA (CHARMA) model of order M.
@@ -841,6 +1217,8 @@ def charma(start_date, end_date, frequency, order, cov_matrix, sigma, tz=None, u
       Unit of the time series values.
     name : str
       Name or nickname of the series.
+    rng : numpy.random.Generator or None
+      Random number generator to use, the module default one if None.
       
     Returns
     -------
@@ -872,20 +1250,24 @@ def charma(start_date, end_date, frequency, order, cov_matrix, sigma, tz=None, u
         for x in row:
             assert(x>=0)
     M = order
+    if rng is None:
+        rng = random_generator
     
     # Generate index
-    data_index = pd.date_range(start=start_date, end=end_date, freq=frequency)
+    data_index = _make_index(start_date, end_date, frequency)
     T = len(data_index)
     
     # Generate the "unit" white noise
-    eta = np.random.normal(loc=0., scale=sigma, size=T)
+    eta = _white_noise(T, sigma, rng=rng)
+    
+    # Generate the lists of coefficients
+    all_coeffs = rng.multivariate_normal(mean=[0.] * M, cov=cov_matrix, size=T)
     
     # Generate the random series
-    a = [0.] * T
+    a = np.empty(T, dtype=np.float64)
     for t in range(T):
         a[t] = eta[t]
-        # Generate the list of coefficients
-        coeffs = np.random.multivariate_normal(mean=[0.] * M, cov=cov_matrix, size=1)[0]
+        coeffs = all_coeffs[t]
         for m in range(M):
             if t-m > 0:
                 a[t] += coeffs[m] * a[t-m-1]
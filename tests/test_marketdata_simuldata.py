@@ -96,7 +96,7 @@ class TestSimuldata(unittest.TestCase):
                                            units=['a','b','c'], name="Random Market Returns")
         # Test attributes values
         self.assertEqual(self.m1.data.shape, (25,3))
-        self.assertEqual(self.m1.start_utc, pd.Period('2017-12', 'M'))
+        self.assertEqual(self.m1.start_utc, pd.Period('2017-11', 'M'))
         self.assertEqual(self.m1.end_utc, pd.Period('2019-11', 'M'))
         self.assertEqual(self.m1.dims, (25,3))
         self.assertEqual(self.m1.tz, 'Europe/Paris')
@@ -104,6 +104,29 @@ class TestSimuldata(unittest.TestCase):
         self.assertEqual(self.m1.freq, 'Unknown')
         self.assertEqual(self.m1.name, "Random Market Returns")
         
+        # Test daily and yearly grids from the start and end dates
+        self.m2 = sd.create_market_returns(r_ini=100., drift=0.1, sigma=0.2, n_years=1, steps_per_year=2, n_components=2,
+                                           date="2019-12-31", date_type="start", interval_type="D")
+        self.assertListEqual(self.m2.data.index.tolist(), [pd.Period('2019-12-31', 'D'), pd.Period('2020-01-01', 'D'),
+                                                           pd.Period('2020-01-02', 'D')])
+        self.m2 = sd.create_market_returns(r_ini=100., drift=0.1, sigma=0.2, n_years=1, steps_per_year=2, n_components=2,
+                                           date="2019-12-31", date_type="end", interval_type="D")
+        self.assertListEqual(self.m2.data.index.tolist(), [pd.Period('2019-12-28', 'D'), pd.Period('2019-12-29', 'D'),
+                                                           pd.Period('2019-12-30', 'D')])
+        self.m2 = sd.create_market_returns(r_ini=100., drift=0.1, sigma=0.2, n_years=2, steps_per_year=1, n_components=2,
+                                           date="2019-12-31", date_type="start", interval_type="Y")
+        self.assertListEqual(self.m2.data.index.tolist(), [pd.Period('2019', 'Y'), pd.Period('2020', 'Y'),
+                                                           pd.Period('2021', 'Y')])
+        self.m2 = sd.create_market_returns(r_ini=100., drift=0.1, sigma=0.2, n_years=2, steps_per_year=1, n_components=2,
+                                           date="2019-12-31", date_type="end", interval_type="Y")
+        self.assertListEqual(self.m2.data.index.tolist(), [pd.Period('2016', 'Y'), pd.Period('2017', 'Y'),
+                                                           pd.Period('2018', 'Y')])
+        
+        # Test wrong date format
+        with self.assertRaises(ValueError):
+            sd.create_market_returns(r_ini=100., drift=0.1, sigma=0.2, n_years=2, steps_per_year=12, n_components=3,
+                                     date="31/12/2019", date_type="end", interval_type="M")
+        
         
     
     
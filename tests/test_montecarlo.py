@@ -12,6 +12,7 @@ import pandas as pd
 
 # Import my package
 from scifin import montecarlo as mc
+from scifin.timeseries import randomseries as rs
     
 
 #---------#---------#---------#---------#---------#---------#---------#---------#---------#
@@ -39,6 +40,31 @@ class TestMonteCarlo(unittest.TestCase):
         pass
 
 
+    def test_spawn_rngs(self):
+        
+        # Spawn generators
+        rngs1 = mc.spawn_rngs(n=3, seed=42)
+        rngs2 = mc.spawn_rngs(n=3, seed=42)
+        
+        # Test generators are reproducible and independent
+        self.assertEqual(len(rngs1), 3)
+        draws1 = [rng.standard_normal(size=5).tolist() for rng in rngs1]
+        draws2 = [rng.standard_normal(size=5).tolist() for rng in rngs2]
+        self.assertListEqual(draws1, draws2)
+        self.assertNotEqual(draws1[0], draws1[1])
+        
+        
+    def test_generate_series_rngs(self):
+        
+        # Generate series from seeded generators
+        rngs = mc.spawn_rngs(n=2, seed=0)
+        L = [rs.random_walk(start_date="2020-01-01", end_date="2020-01-31", frequency='D',
+                            start_value=1., sigma=1., rng=rng) for rng in rngs]
+        
+        # Test values
+        self.assertEqual(len(L), 2)
+        self.assertNotEqual(L[0].data.values.tolist(), L[1].data.values.tolist())
+
     
     
     
@@ -10,6 +10,7 @@ import unittest
 from datetime import datetime
 
 # Import third party packages
+import numpy as np
 import pandas as pd
 import pytz
 
@@ -62,6 +63,152 @@ class TestRandomSeries(unittest.TestCase):
         self.assertEqual(self.rs1.tz, "Europe/London")
         self.assertEqual(self.rs1.timezone, pytz.timezone("Europe/London"))
         self.assertEqual(self.rs1.name, "Cst time series")
+        
+        
+    def test_randomseries_auto_regressive(self):
+        
+        # Define a noiseless AR(2) series
+        self.rs1 = rs.auto_regressive(start_date="2020-01-01", end_date="2020-01-05", frequency='D',
+                                      start_values=[0., 1.], cst=1., order=2, coeffs=[0.5, 0.25], sigma=0.)
+        
+        # Test values
+        self.assertListEqual(self.rs1.data.values.tolist(), [0., 1., 1.5, 2., 2.375])
+        self.assertEqual(self.rs1.nvalues, 5)
+        
+        
+    def test_randomseries_random_walks(self):
+        
+        # Define noiseless random walks
+        self.rs1 = rs.random_walk(start_date="2020-01-01", end_date="2020-01-04", frequency='D',
+                                  start_value=2., sigma=0.)
+        self.rs2 = rs.drift_random_walk(start_date="2020-01-01", end_date="2020-01-04", frequency='D',
+                                        start_value=2., drift=0.5, sigma=0.)
+        
+        # Test values
+        self.assertListEqual(self.rs1.data.values.tolist(), [2., 2., 2., 2.])
+        self.assertListEqual(self.rs2.data.values.tolist(), [2., 2.5, 3., 3.5])
+        
+        
+    def test_randomseries_arma(self):
+        
+        # Define a noiseless ARMA(1,1) series
+        self.rs1 = rs.arma(start_date="2020-01-01", end_date="2020-01-04", frequency='D',
+                           start_values=[1.], cst=1., ARorder=1, ARcoeffs=[0.5], MAorder=1, MAcoeffs=[0.5], sigma=0.)
+        
+        # Test values
+        self.assertListEqual(self.rs1.data.values.tolist(), [1., 1.5, 1.75, 1.875])
+        
+        
+    def test_randomseries_scenarios(self):
+        
+        # Define noiseless AR(2) scenarios
+        self.list_rs = rs.auto_regressive(start_date="2020-01-01", end_date="2020-01-05", frequency='D',
+                                          start_values=[0., 1.], cst=1., order=2, coeffs=[0.5, 0.25], sigma=0.,
+                                          n_scenarios=3, name="ar")
+        
+        # Test values
+        self.assertEqual(len(self.list_rs), 3)
+        for ts in self.list_rs:
+            self.assertListEqual(ts.data.values.tolist(), [0., 1., 1.5, 2., 2.375])
+        self.assertListEqual([ts.name for ts in self.list_rs], ["ar0", "ar1", "ar2"])
+        
+        # Define ARMA scenarios
+        self.list_rs = rs.arma(start_date="2020-01-01", end_date="2020-12-31", frequency='D',
+                               start_values=[1.], cst=1., ARorder=1, ARcoeffs=[0.5], MAorder=1, MAcoeffs=[0.5],
+                               sigma=1., n_scenarios=2)
+        
+        # Test scenarios are different
+        self.assertEqual(self.list_rs[0].nvalues, 366)
+        self.assertNotEqual(self.list_rs[0].data.values.tolist(), self.list_rs[1].data.values.tolist())
+        
+        
+    def test_randomseries_parallel(self):
+        
+        # Define noiseless AR(2) scenarios generated in parallel
+        self.list_rs = rs.auto_regressive(start_date="2020-01-01", end_date="2020-01-05", frequency='D',
+                                          start_values=[0., 1.], cst=1., order=2, coeffs=[0.5, 0.25], sigma=0.,
+                                          n_scenarios=3, parallel=True)
+        
+        # Test values
+        self.assertEqual(len(self.list_rs), 3)
+        for ts in self.list_rs:
+            self.assertListEqual(ts.data.values.tolist(), [0., 1., 1.5, 2., 2.375])
+        
+        # Define ARMA scenarios generated in parallel from the same seed
+        list_x = []
+        for _ in range(2):
+            list_rs = rs.arma(start_date="2020-01-01", end_date="2020-12-31", frequency='D',
+                              start_values=[1.], cst=1., ARorder=1, ARcoeffs=[0.5], MAorder=1, MAcoeffs=[0.5],
+                              sigma=1., n_scenarios=4, dtype=np.float32, rng=np.random.default_rng(42),
+                              parallel=True)
+            list_x.append(np.column_stack([ts.data.values for ts in list_rs]))
+        
+        # Test reproducibility and precision
+        np.testing.assert_array_equal(list_x[0], list_x[1])
+        self.assertEqual(list_x[0].dtype, np.float32)
+        
+        
+    def test_randomseries_dtype(self):
+        
+        # Define single precision series
+        self.rs1 = rs.auto_regressive(start_date="2020-01-01", end_date="2020-12-31", frequency='D',
+                                      start_values=[0., 1.], cst=1., order=2, coeffs=[0.5, 0.25], sigma=1.,
+                                      dtype=np.float32)
+        self.rs2 = rs.moving_average(start_date="2020-01-01", end_date="2020-12-31", frequency='D',
+                                     cst=1., order=1, coeffs=[0.5], sigma=1., dtype=np.float32)
+        
+        # Test types
+        self.assertEqual(self.rs1.data.dtype, np.float32)
+        self.assertEqual(self.rs2.data.dtype, np.float32)
+        
+        
+    def test_ma_filter(self):
+        
+        # Compare the direct and FFT convolutions with the MA recursion
+        a = np.random.normal(loc=0., scale=1., size=(1000, 2))
+        for Q in [5, rs.FFT_MIN_ORDER]:
+            coeffs = np.random.uniform(low=-0.1, high=0.1, size=Q)
+            x_kernel = rs._arma_kernel(a[:,0], np.empty(1000), 0., rs._pack_arma_coeffs([], coeffs, np.float64), 0,
+                                       np.array([]))
+            
+            # Test values
+            np.testing.assert_allclose(rs._ma_filter(coeffs, a[:,0]), x_kernel)
+            np.testing.assert_allclose(rs._ma_filter(coeffs, a)[:,0], x_kernel)
+        
+        
+    def test_arma_kernel(self):
+        
+        # Compare the ARMA kernel with the lfilter recursion
+        a = np.random.normal(loc=0., scale=1., size=200)
+        coeffs = rs._pack_arma_coeffs([0.3, -0.2], [0.4, 0.1, 0.2], np.float64)
+        x_kernel = rs._arma_kernel(a, np.empty(200), 0.1, coeffs, 2, np.array([1., 2.]))
+        x_filter = rs._ar_recursion([1., 2.], [0.3, -0.2], 0.1 + rs._ma_filter([0.4, 0.1, 0.2], a))
+        
+        # Test values
+        np.testing.assert_allclose(x_kernel, x_filter)
+        
+        # Compare with the compiled kernel if numba is available
+        kernel = rs._compiled_arma_kernel()
+        if kernel is not None:
+            x_compiled = kernel(a, np.empty(200), 0.1, coeffs, 2, np.array([1., 2.]))
+            np.testing.assert_allclose(x_compiled, x_filter)
+        
+        # Compare with the parallel kernel if numba is available
+        kernel = rs._compiled_arma_paths_kernel()
+        if kernel is not None:
+            x_paths = kernel(np.vstack([a, a]), np.empty((2, 200)), 0.1, coeffs, 2, np.array([1., 2.]))
+            np.testing.assert_allclose(x_paths[1], x_filter)
+        
+        
+    def test_ar_recursion_blas(self):
+        
+        # Compare the BLAS recursion with the lfilter recursion over scenarios
+        u = np.random.normal(loc=0., scale=1., size=(100, 5))
+        x_blas = rs._ar_recursion_blas([1., 2., 3.], [0.3, -0.2, 0.1], u)
+        x_filter = rs._ar_recursion([1., 2., 3.], [0.3, -0.2, 0.1], u)
+        
+        # Test values
+        np.testing.assert_allclose(x_blas, x_filter)
 
     
 if __name__ == '__main__':